@@ -11,9 +11,9 @@ Example:
         ...
 """
 from anthill.platform.api.internal import as_internal, InternalAPI
-from message.routes import MESSENGER_NAMESPACE
+from anthill.framework.conf import settings
 
 
 @as_internal()
 async def get_messenger_namespace(api: InternalAPI, **options):
-    return MESSENGER_NAMESPACE
+    return settings.MESSENGER_NAMESPACE
@@ -1,6 +1,4 @@
 import graphene
-from graphene_sqlalchemy import SQLAlchemyObjectType
-from message import models
 
 
 class RootQuery(graphene.ObjectType):
@@ -32,6 +32,122 @@ Example:
         pass
 
 """
+import os
+import re
+import subprocess
+import sys
+import time
 from anthill.framework.core.management import Command, Option, Manager
 
 # Create your management commands here.
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_REPORT_MARKER = '-- import report --'
+
+_setup_code = (
+    'import sys, anthill.framework\n'
+    'anthill.framework.setup()\n'
+    'sys.stderr.write(%r)\n'
+    'sys.stderr.flush()\n' % (IMPORT_REPORT_MARKER + '\n')
+)
+
+# Startup path of each process role, run in a fresh interpreter.
+# web and worker replay what the server and the Celery worker load
+# before serving; cli runs manage.py itself.
+IMPORT_REPORT_ROLES = {
+    'web': _setup_code + (
+        'from importlib import import_module\n'
+        'from anthill.framework.apps import app\n'
+        'from anthill.framework.conf import settings\n'
+        'import_module(getattr(settings, "ROUTES_CONF", None) or "message.routes")\n'
+        'service_class = getattr(settings, "SERVICE_CLASS", None) or "message.services.Service"\n'
+        'import_module(service_class.rsplit(".", 1)[0])\n'
+        'import_module(settings.GRAPHENE["SCHEMA"].rsplit(".", 1)[0])\n'
+    ),
+    'worker': _setup_code + (
+        'from anthill.platform.core.celery import app\n'
+        'import message.tasks\n'
+        'app.loader.import_default_modules()\n'
+    ),
+    'cli': (
+        'import runpy, sys\n'
+        'sys.argv = ["manage.py", "--help"]\n'
+        'runpy.run_path("manage.py", run_name="__main__")\n'
+    ),
+}
+
+_importtime_re = re.compile(r'^import time:\s*(\d+) \|\s*(\d+) \| ( *)(\S.*)$')
+
+
+def parse_importtime(output, marker=None):
+    """
+    Parse `python -X importtime` output into a list of
+    (cumulative_us, self_us, depth, module) tuples.
+    If marker is given, lines before it are skipped.
+    """
+    lines = output.splitlines()
+    if marker is not None:
+        lines = lines[lines.index(marker) + 1:] if marker in lines else []
+    result = []
+    for line in lines:
+        match = _importtime_re.match(line)
+        if match is None:  # header or unrelated output
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        result.append((int(cumulative_us), int(self_us), len(indent) // 2, module))
+    return result
+
+
+def total_import_time(timings):
+    """Sum cumulative time of top level imports, in microseconds."""
+    return sum(t[0] for t in timings if t[2] == 0)
+
+
+class ImportTimeReport(Command):
+    help = 'Report cold-start time of a service process role.'
+    name = 'import_report'
+
+    option_list = (
+        Option('-r', '--role', dest='role', default='web',
+               choices=sorted(IMPORT_REPORT_ROLES),
+               help='process role to measure startup of.'),
+        Option('-n', '--limit', dest='limit', type=int, default=20,
+               help='number of slowest imports to show.'),
+    )
+
+    @staticmethod
+    def measure(code):
+        """
+        Run code in a fresh interpreter with `-X importtime`.
+        Return (wall_us, timings, timings_after_setup) where the last
+        item is empty unless code writes IMPORT_REPORT_MARKER.
+        """
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            universal_newlines=True, cwd=BASE_DIR)
+        wall_us = int((time.perf_counter() - started) * 1000000)
+        if proc.returncode:
+            lines = proc.stderr.strip().splitlines()
+            raise RuntimeError('exit %d: %s' % (proc.returncode, lines[-1] if lines else ''))
+        return (wall_us, parse_importtime(proc.stderr),
+                parse_importtime(proc.stderr, marker=IMPORT_REPORT_MARKER))
+
+    @staticmethod
+    def print_timings(timings, limit):
+        print('%12s %12s  %s' % ('cumulative', 'self', 'module'))
+        for cumulative_us, self_us, depth, module in sorted(timings, reverse=True)[:limit]:
+            print('%10.1fms %10.1fms  %s' % (cumulative_us / 1000, self_us / 1000, module))
+
+    def run(self, role='web', limit=20):
+        wall_us, timings, after_setup = self.measure(IMPORT_REPORT_ROLES[role])
+        print('Role: %s' % role)
+        print('Process wall time: %.1f ms' % (wall_us / 1000))
+        print('Import time: %.1f ms' % (total_import_time(timings) / 1000))
+        self.print_timings(timings, limit)
+        if after_setup:
+            print()
+            print('After framework setup: %.1f ms' % (total_import_time(after_setup) / 1000))
+            self.print_timings(after_setup, limit)
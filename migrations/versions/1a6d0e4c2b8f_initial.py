@@ -0,0 +1,84 @@
+"""initial
+
+Revision ID: 1a6d0e4c2b8f
+Revises: 
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1a6d0e4c2b8f'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'messages',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('sender_id', sa.Integer(), nullable=False),
+        sa.Column('group_id', sa.Integer(), nullable=False),
+        sa.Column('created', sa.DateTime(), nullable=True),
+        sa.Column('updated', sa.DateTime(), nullable=True),
+        sa.Column('active', sa.Boolean(), nullable=False),
+        sa.Column('draft', sa.Boolean(), nullable=False),
+        sa.Column('discriminator', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'message_statuses',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('value', sa.Unicode(length=255), nullable=True),
+        sa.Column('updated', sa.DateTime(), nullable=True),
+        sa.Column('message_id', sa.Integer(), nullable=True),
+        sa.Column('receiver_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['message_id'], ['messages.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'message_reactions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('value', sa.String(length=32), nullable=True),
+        sa.Column('message_id', sa.Integer(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['message_id'], ['messages.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('message_id', 'user_id', 'value')
+    )
+    op.create_table(
+        'text_messages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_type', sa.String(length=128), nullable=False),
+        sa.Column('value', sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(['id'], ['messages.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'file_messages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_type', sa.String(length=128), nullable=False),
+        sa.Column('value', sa.UnicodeText(), nullable=False),
+        sa.ForeignKeyConstraint(['id'], ['messages.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'url_messages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_type', sa.String(length=128), nullable=False),
+        sa.Column('value', sa.UnicodeText(), nullable=False),
+        sa.ForeignKeyConstraint(['id'], ['messages.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('url_messages')
+    op.drop_table('file_messages')
+    op.drop_table('text_messages')
+    op.drop_table('message_reactions')
+    op.drop_table('message_statuses')
+    op.drop_table('messages')
@@ -0,0 +1,65 @@
+"""compact message statuses
+
+Revision ID: 3f2b9c1d7a4e
+Revises: 1a6d0e4c2b8f
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2b9c1d7a4e'
+down_revision = '1a6d0e4c2b8f'
+branch_labels = None
+depends_on = None
+
+
+# Rows updated per transaction during backfills.
+BATCH_SIZE = 10000
+
+
+def batched_update(sql):
+    """
+    Run UPDATE sql over primary key ranges of message_statuses;
+    sql has a {where} placeholder for the range condition.
+    Each batch commits on its own, so vacuum can reclaim dead tuples
+    while the update is running and no single transaction holds the
+    whole table.
+    """
+    if context.is_offline_mode():
+        op.execute(sql.format(where='true'))
+        return
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text('SELECT max(id) FROM message_statuses')).scalar() or 0
+    sql = sql.format(where='id > :start AND id <= :end')
+    with op.get_context().autocommit_block():
+        for start in range(0, max_id, BATCH_SIZE):
+            bind.execute(sa.text(sql), start=start, end=start + BATCH_SIZE)
+
+
+def upgrade():
+    op.add_column('message_statuses', sa.Column(
+        'read', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Dropped before the backfill, so rewritten rows do not carry it.
+    op.drop_column('message_statuses', 'updated')
+    batched_update("UPDATE message_statuses SET read = true WHERE {where} AND value = 'read'")
+    op.drop_column('message_statuses', 'value')
+    with op.get_context().autocommit_block():
+        op.create_index('ix_message_statuses_unread', 'message_statuses',
+                        ['receiver_id', 'message_id'], unique=False,
+                        postgresql_where=sa.text('NOT read'),
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_message_statuses_unread', table_name='message_statuses',
+                      postgresql_concurrently=True)
+    op.add_column('message_statuses', sa.Column('updated', sa.DateTime(), nullable=True))
+    op.add_column('message_statuses', sa.Column('value', sa.Unicode(length=255), nullable=True))
+    batched_update(
+        "UPDATE message_statuses SET value = CASE WHEN read THEN 'read' ELSE 'new' END "
+        "WHERE {where}")
+    op.drop_column('message_statuses', 'read')
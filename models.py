@@ -4,10 +4,10 @@ from anthill.framework.db import db
 from anthill.framework.utils import timezone
 from anthill.platform.api.internal import InternalAPIMixin
 from anthill.platform.auth import RemoteUser
-from anthill.framework.utils.translation import translate_lazy as _
 from anthill.framework.utils.asynchronous import as_future
 from anthill.framework.utils.functional import SimpleLazyObject
-from sqlalchemy_utils.types import ChoiceType, URLType
+from sqlalchemy_utils.types import URLType
+from sqlalchemy.ext.hybrid import hybrid_property
 from functools import partial
 import re
 import six
@@ -61,22 +61,34 @@ class UrlRegex:
 url_regex = UrlRegex()
 
 
-MESSAGE_STATUSES = (
-    ('new', _('New')),
-    ('read', _('Read')),
-)
-
-
 class MessageStatus(InternalAPIMixin, db.Model):
     __tablename__ = 'message_statuses'
+    __table_args__ = (
+        # Covers unread rows only, so it stays small as messages get read.
+        db.Index('ix_message_statuses_unread', 'receiver_id', 'message_id',
+                 postgresql_where=db.text('NOT read')),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    value = db.Column(ChoiceType(MESSAGE_STATUSES), default='new')
-    updated = db.Column(db.DateTime, onupdate=timezone.now)
+    read = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
     message_id = db.Column(
         db.Integer, db.ForeignKey('messages.id', ondelete='CASCADE'))
     receiver_id = db.Column(db.Integer)
 
+    # Former 'new'/'read' string status, kept for existing callers.
+    # Filter on `read` instead to use the unread index.
+    @hybrid_property
+    def value(self):
+        return 'read' if self.read else 'new'
+
+    @value.setter
+    def value(self, value):
+        self.read = value == 'read'
+
+    @value.expression
+    def value(cls):
+        return db.case([(cls.read, 'read')], else_='new')
+
     @property
     def request_user(self):
         return partial(self.internal_request, 'login', 'get_user')
@@ -152,7 +164,7 @@ class Message(InternalAPIMixin, db.Model):
     @as_future
     def new_messages(cls, receiver_id, **kwargs):
         return cls.query.filter_by(active=True, **kwargs).join(MessageStatus) \
-            .filter(MessageStatus.receiver_id == receiver_id, MessageStatus.value == 'new')
+            .filter(MessageStatus.receiver_id == receiver_id, db.not_(MessageStatus.read))
 
     @as_future
     def add_reaction(self, user_id, value):
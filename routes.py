@@ -3,11 +3,12 @@
 from tornado.web import url
 from .api.v1.rest import routes as rest_routes
 from anthill.framework.utils.urls import include
+from anthill.framework.conf import settings
 from anthill.framework.handlers.socketio import socketio_server
 from anthill.platform.core.messenger.handlers.transports import socketio
 from . import handlers
 
-MESSENGER_NAMESPACE = '/messenger'
+MESSENGER_NAMESPACE = settings.MESSENGER_NAMESPACE
 
 socketio_server.register_namespace(handlers.MessengerNamespace(MESSENGER_NAMESPACE))
 
@@ -31,6 +31,8 @@ APPLICATION_COLOR = 'green'
 
 # SERVICE_CLASS = 'message.services.Service'
 
+MESSENGER_NAMESPACE = '/messenger'
+
 TEMPLATE_PATH = os.path.join(BASE_DIR, 'ui', 'templates')
 LOCALE_PATH = os.path.join(BASE_DIR, 'locale')
 
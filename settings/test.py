@@ -0,0 +1,4 @@
+from .base import *
+
+# Tests create and drop all tables, never point this at a real database.
+SQLALCHEMY_DATABASE_URI = 'postgres://anthill_message@/test_anthill_message'
@@ -2,4 +2,6 @@
 
 # Setup postgres database
 createuser -d anthill_message -U postgres
-createdb -U anthill_message anthill_message
\ No newline at end of file
+createdb -U anthill_message anthill_message
+# Setup test database (ANTHILL_SETTINGS_MODULE=settings.test)
+createdb -U anthill_message test_anthill_message
@@ -0,0 +1,15 @@
+"""
+Tests create and drop all tables, run them with test settings:
+
+    ANTHILL_SETTINGS_MODULE=settings.test
+"""
+from anthill.framework.db import db
+
+
+def check_test_database():
+    """Refuse to run against a database not named test_*."""
+    name = db.engine.url.database or ''
+    if not name.startswith('test_'):
+        raise RuntimeError(
+            'Tests must run against a test_* database, not %r. '
+            'Use ANTHILL_SETTINGS_MODULE=settings.test.' % name)
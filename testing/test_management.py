@@ -0,0 +1,67 @@
+from message.management import (
+    ImportTimeReport, IMPORT_REPORT_MARKER, IMPORT_REPORT_ROLES,
+    parse_importtime, total_import_time)
+from unittest import mock, TestCase
+import subprocess
+
+IMPORTTIME_OUTPUT = '\n'.join([
+    'import time: self [us] | cumulative | imported package',
+    'import time:       120 |        120 | site',
+    IMPORT_REPORT_MARKER,
+    'import time:       100 |        100 |     _sre',
+    'import time:       200 |        300 |   re._compiler',
+    'import time:       400 |        700 | re',
+    'some unrelated warning',
+])
+
+
+class ParseImportTimeTestCase(TestCase):
+    def test_parse(self):
+        result = parse_importtime(IMPORTTIME_OUTPUT)
+        self.assertEqual(result, [
+            (120, 120, 0, 'site'),
+            (100, 100, 2, '_sre'),
+            (300, 200, 1, 're._compiler'),
+            (700, 400, 0, 're'),
+        ])
+
+    def test_parse_after_marker(self):
+        result = parse_importtime(IMPORTTIME_OUTPUT, marker=IMPORT_REPORT_MARKER)
+        self.assertEqual([t[3] for t in result], ['_sre', 're._compiler', 're'])
+
+    def test_parse_missing_marker(self):
+        self.assertEqual(parse_importtime('', marker=IMPORT_REPORT_MARKER), [])
+
+
+    def test_total_import_time(self):
+        self.assertEqual(total_import_time(parse_importtime(IMPORTTIME_OUTPUT)), 820)
+
+
+class ImportTimeReportTestCase(TestCase):
+    def _run(self, returncode, stderr):
+        proc = subprocess.CompletedProcess([], returncode, stderr=stderr)
+        with mock.patch('message.management.subprocess.run', return_value=proc):
+            return ImportTimeReport.measure(IMPORT_REPORT_ROLES['worker'])
+
+    def test_measure(self):
+        wall_us, timings, after_setup = self._run(0, IMPORTTIME_OUTPUT)
+        self.assertGreaterEqual(wall_us, 0)
+        self.assertEqual(total_import_time(timings), 820)
+        self.assertEqual(total_import_time(after_setup), 700)
+
+    def test_measure_without_marker(self):
+        wall_us, timings, after_setup = self._run(0, IMPORTTIME_OUTPUT.replace(IMPORT_REPORT_MARKER, ''))
+        self.assertEqual(total_import_time(timings), 820)
+        self.assertEqual(after_setup, [])
+
+    def test_roles_compile(self):
+        for role, code in IMPORT_REPORT_ROLES.items():
+            compile(code, role, 'exec')
+
+    def test_measure_failed_child(self):
+        with self.assertRaisesRegex(RuntimeError, r'^exit 1: ImportError: boom$'):
+            self._run(1, 'Traceback...\nImportError: boom\n')
+
+    def test_measure_failed_child_without_stderr(self):
+        with self.assertRaisesRegex(RuntimeError, r'^exit 3: $'):
+            self._run(3, '')
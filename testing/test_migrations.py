@@ -0,0 +1,49 @@
+from alembic import command
+from alembic.config import Config
+from anthill.framework.db import db
+from message.testing import check_test_database
+from unittest import TestCase
+import os
+
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+class CompactMessageStatusesMigrationTestCase(TestCase):
+    initial = '1a6d0e4c2b8f'
+    compact = '3f2b9c1d7a4e'
+
+    def setUp(self):
+        check_test_database()
+        db.drop_all()
+        # Start from an unstamped database whatever ran before.
+        self.execute('DROP TABLE IF EXISTS alembic_version')
+        self.config = Config(os.path.join(MIGRATIONS_DIR, 'alembic.ini'))
+        self.config.set_main_option('script_location', MIGRATIONS_DIR)
+        command.upgrade(self.config, self.initial)
+
+    def tearDown(self):
+        db.session.remove()
+        command.downgrade(self.config, 'base')
+
+    def execute(self, sql, **params):
+        result = db.session.execute(db.text(sql), params)
+        db.session.commit()
+        return result
+
+    def test_upgrade_downgrade(self):
+        self.execute(
+            "INSERT INTO messages (id, sender_id, group_id, active, draft) "
+            "VALUES (1, 1, 1, true, false)")
+        for status_id, value in ((1, 'new'), (2, 'read'), (3, None)):
+            self.execute(
+                "INSERT INTO message_statuses (id, value, message_id, receiver_id) "
+                "VALUES (:id, :value, 1, 2)", id=status_id, value=value)
+
+        command.upgrade(self.config, self.compact)
+        rows = self.execute('SELECT read FROM message_statuses ORDER BY id').fetchall()
+        self.assertEqual([r[0] for r in rows], [False, True, False])
+
+        command.downgrade(self.config, self.initial)
+        rows = self.execute('SELECT value FROM message_statuses ORDER BY id').fetchall()
+        self.assertEqual([r[0] for r in rows], ['new', 'read', 'new'])
@@ -0,0 +1,61 @@
+from anthill.framework.db import db
+from message.models import Message, MessageStatus
+from message.testing import check_test_database
+from tornado.testing import AsyncTestCase, gen_test
+
+
+class MessageStatusTestCase(AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        check_test_database()
+        db.create_all()
+        self.message = Message(sender_id=1, group_id=1)
+        db.session.add(self.message)
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        super().tearDown()
+
+    def add_status(self, receiver_id, **kwargs):
+        status = MessageStatus(message_id=self.message.id, receiver_id=receiver_id, **kwargs)
+        db.session.add(status)
+        db.session.commit()
+        return status
+
+    def test_default_unread(self):
+        status = self.add_status(receiver_id=2)
+        self.assertIs(status.read, False)
+
+    def test_server_default_unread(self):
+        db.session.execute(
+            db.text('INSERT INTO message_statuses (message_id, receiver_id) VALUES (:m, :r)'),
+            {'m': self.message.id, 'r': 2})
+        db.session.commit()
+        status = MessageStatus.query.filter_by(receiver_id=2).one()
+        self.assertIs(status.read, False)
+
+    @gen_test
+    async def test_new_messages(self):
+        read_message = Message(sender_id=1, group_id=1)
+        db.session.add(read_message)
+        db.session.commit()
+        self.add_status(receiver_id=2)
+        self.add_status(receiver_id=3)
+        db.session.add(MessageStatus(message_id=read_message.id, receiver_id=2, read=True))
+        db.session.commit()
+
+        query = await Message.new_messages(receiver_id=2)
+        self.assertEqual([m.id for m in query.all()], [self.message.id])
+
+        query = await Message.new_messages(receiver_id=4)
+        self.assertEqual(query.all(), [])
+
+    def test_value_compatibility(self):
+        status = self.add_status(receiver_id=2, value='read')
+        self.assertIs(status.read, True)
+        self.assertEqual(status.value, 'read')
+        self.add_status(receiver_id=3)
+        self.assertEqual(
+            [s.receiver_id for s in MessageStatus.query.filter(MessageStatus.value == 'new')], [3])